@@ -9,6 +9,7 @@
 #include "audioguard/AudioLoader.h"
 #include "audioguard/Preprocessor.h"
 #include "audioguard/InferenceEngine.h"
+#include "audioguard/RuntimeProfile.h"
 
 // Standard Mini Speech Commands Classes
 const std::vector<std::string> LABELS = {
@@ -24,7 +25,7 @@ int argmax(const std::vector<float>& scores) {
 int main(int argc, char* argv[]) {
     // 1. Argument Check
     if (argc < 3) {
-        std::cerr << "Usage: ./AudioGuardApp <path_to_model.onnx> <path_to_audio.wav>\n";
+        std::cerr << "Usage: ./AudioGuardApp <path_to_model.onnx> <path_to_audio.wav> [runtime_profile.cfg]\n";
         return 1;
     }
 
@@ -35,7 +36,9 @@ int main(int argc, char* argv[]) {
     std::cout << "   AudioGuard C++ Inference Engine v1.0   \n";
     std::cout << "==========================================\n";
     std::cout << "Model: " << model_path << "\n";
-    std::cout << "Input: " << audio_path << "\n\n";
+    std::cout << "Input: " << audio_path << "\n";
+    if (argc > 3) std::cout << "Profile: " << argv[3] << "\n";
+    std::cout << "\n";
 
     try {
         // ---------------------------------------------------------
@@ -44,7 +47,11 @@ int main(int argc, char* argv[]) {
         // We do this OUTSIDE the timer because in a real app, 
         // the model is loaded once at startup.
         std::cout << "[Init] Loading Model... ";
-        audioguard::InferenceEngine engine(model_path);
+        // Explicit profile wins; otherwise $AUDIOGUARD_PROFILE (or ORT defaults)
+        audioguard::RuntimeProfile profile = (argc > 3)
+            ? audioguard::RuntimeProfile::load(argv[3])
+            : audioguard::RuntimeProfile::from_env();
+        audioguard::InferenceEngine engine(model_path, profile);
         std::cout << "Ready.\n";
 
         // --- START TIMER ---
@@ -0,0 +1,89 @@
+import sys
+import os
+
+# 1. Setup Path to the autotuner at the project root (no C++ build needed)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from autotune import (BASE_CONFIG_PATH, parse_args, build_search_space,
+                      pareto_front, choose_operating_point, render_triton_config)
+
+KNOBS = dict(dsp_workers=2, intra_op_threads=4, inter_op_threads=1,
+             batch_size=4, instance_count=3)
+
+def result(throughput, p99_ms):
+    return dict(KNOBS, throughput=throughput, p99_ms=p99_ms)
+
+def test_pareto_front():
+    print("\n--- Testing Pareto Front ---")
+    fast, balanced, dominated, lean = (result(200, 8.0), result(100, 5.0),
+                                       result(150, 9.0), result(90, 2.0))
+    front = pareto_front([fast, balanced, dominated, lean])
+    print(f"Front (req/s): {[r['throughput'] for r in front]}")
+    assert front == [fast, balanced, lean], "Dominated point kept or Pareto point dropped"
+    print(" PASSED: Pareto front keeps only non-dominated points!")
+
+def test_choose_operating_point():
+    print("\n--- Testing Operating Point Selection ---")
+    front = [result(200, 8.0), result(100, 5.0), result(90, 2.0)]
+    assert choose_operating_point(front)["throughput"] == 200, \
+        "Without a budget the fastest point should win"
+    assert choose_operating_point(front, p99_budget_ms=6.0)["throughput"] == 100, \
+        "Should pick the fastest point within the p99 budget"
+    assert choose_operating_point(front, p99_budget_ms=1.0)["throughput"] == 90, \
+        "Should fall back to the lowest p99 when nothing fits the budget"
+    print(" PASSED: Operating point honours the p99 budget and its fallback!")
+
+def test_render_triton_config():
+    print("\n--- Testing Triton config.pbtxt Variant ---")
+    with open(BASE_CONFIG_PATH) as f:
+        base = f.read()
+
+    once = render_triton_config(base, KNOBS, 100)
+    print(once)
+    assert "max_batch_size: 4" in once, "max_batch_size not rewritten"
+    assert "count: 3" in once and "kind: KIND_GPU" in once, "instance_group count not rewritten"
+    assert "preferred_batch_size: [ 4 ]" in once, "dynamic_batching missing"
+    assert 'string_value: "4"' in once, "intra-op thread parameter missing"
+
+    twice = render_triton_config(once, KNOBS, 100)
+    assert twice == once, "Re-rendering a tuned config changed it"
+    assert twice.count("dynamic_batching") == 1, "dynamic_batching duplicated"
+    assert twice.count("parameters {") == 2, "parameters duplicated"
+
+    unbatched = render_triton_config(once, dict(KNOBS, batch_size=1), 100)
+    assert "dynamic_batching" not in unbatched, "dynamic_batching kept for batch size 1"
+    print(" PASSED: Config variant is rewritten in place and idempotent!")
+
+def test_search_space_clipping():
+    print("\n--- Testing Search Space Clipping ---")
+    cores = os.cpu_count() or 1
+    args = parse_args(["--dsp-workers", str(cores + 8), "--intra-op-threads", "1",
+                       "--inter-op-threads", "1", "--batch-sizes", "1",
+                       "--instance-counts", str(cores + 8)])
+    space = build_search_space(args)
+    assert [k["dsp_workers"] for k in space] == [cores], "DSP workers not clipped to cores"
+    assert [k["instance_count"] for k in space] == [cores + 8], \
+        "GPU instance count must not be clipped to host cores"
+    print(" PASSED: Only thread knobs are clipped to the host!")
+
+def test_invalid_arguments_rejected():
+    print("\n--- Testing Argument Validation ---")
+    for argv in (["--clips", "0"], ["--requests", "0"], ["--batch-sizes", ","],
+                 ["--batch-sizes", "0"], ["--instance-counts", "-1"],
+                 ["--dsp-workers", "0,2"]):
+        try:
+            parse_args(argv)
+        except SystemExit:
+            print(f"Rejected: {' '.join(argv)}")
+        else:
+            assert False, f"Invalid arguments accepted: {argv}"
+    print(" PASSED: Empty or invalid search spaces are rejected up front!")
+
+if __name__ == "__main__":
+    test_pareto_front()
+    test_choose_operating_point()
+    test_render_triton_config()
+    test_search_space_clipping()
+    test_invalid_arguments_rejected()
@@ -0,0 +1,83 @@
+import sys
+import os
+
+# 1. Setup Path to the load generator at the project root
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import argparse
+
+from load_generator import (start_stub_server, make_http_target, arrival_schedule,
+                            run_open_loop, find_saturation, parse_rates)
+
+def test_load_generator():
+    print("\n--- Testing Open-Loop Load Generator (Stub Server) ---")
+
+    # A. Stub with a fixed 5 ms service time, one worker => ~200 req/s capacity
+    server, address = start_stub_server(latency_ms=5.0)
+    print(f"Stub listening on: {address}")
+    target = make_http_target(address, "audioguard")
+    target()  # warmup / connectivity check
+
+    # B. Well below capacity: should keep up and stay near the service time
+    light = run_open_loop(target, rate=50, duration=2.0, arrival="fixed", max_workers=1)
+    print(f"   50 req/s -> achieved {light['achieved_rps']:.1f}, p99 {light['p99_ms']:.2f} ms")
+
+    # C. Far above capacity: queueing must show up in the latency (no coordinated omission)
+    heavy = run_open_loop(target, rate=1000, duration=1.0, arrival="poisson", max_workers=1)
+    print(f" 1000 req/s -> achieved {heavy['achieved_rps']:.1f}, p99 {heavy['p99_ms']:.2f} ms, "
+          f"service p99 {heavy['service_p99_ms']:.2f} ms")
+    server.shutdown()
+
+    assert not light["errors"] and not heavy["errors"], "Stub returned errors."
+    assert light["achieved_rps"] >= 0.9 * light["sent_rps"], "Could not sustain a light load."
+    assert heavy["p99_ms"] >= 10 * heavy["service_p99_ms"], \
+        "Overload latency looks closed-loop (queueing time missing)."
+    assert find_saturation([light, heavy]) is heavy, \
+        "Saturation point not detected at the overloaded rate."
+
+    print(" PASSED: Open-loop latency captures queueing under overload!")
+
+def test_failed_requests_counted():
+    print("\n--- Testing Error-Inclusive Latency ---")
+
+    # Every request fails after 20 ms: success-only stats are empty, but the
+    # error-inclusive tail must still reflect the time those requests took
+    server, address = start_stub_server(latency_ms=20.0, error_rate=1.0)
+    target = make_http_target(address, "audioguard")
+    point = run_open_loop(target, rate=20, duration=1.0, arrival="fixed", max_workers=4)
+    server.shutdown()
+    print(f"   errors {point['errors']}/{point['sent']}, p99 incl. errors {point['p99_all_ms']:.2f} ms")
+
+    assert point["ok"] == 0 and point["errors"] == point["sent"], "Injected failures not counted."
+    assert point["p99_all_ms"] >= 20.0, "Failed requests missing from error-inclusive latency."
+    assert find_saturation([point]) is point, "Error rate did not mark saturation."
+
+    print(" PASSED: Failed requests are counted in tail latency!")
+
+def test_invalid_rates_rejected():
+    print("\n--- Testing Offered-Rate Validation ---")
+
+    for text in ("0", "-5", ",", "50,0"):
+        try:
+            parse_rates(text)
+            assert False, f"--rates '{text}' was accepted."
+        except argparse.ArgumentTypeError as e:
+            print(f"Rejected --rates '{text}': {e}")
+
+    for rate in (0, -5):
+        for call in (lambda: arrival_schedule(rate, 1.0, "fixed"),
+                     lambda: run_open_loop(lambda: None, rate, 1.0)):
+            try:
+                call()
+                assert False, f"rate={rate} was accepted."
+            except ValueError:
+                pass
+
+    print(" PASSED: Non-positive and empty rates are rejected!")
+
+if __name__ == "__main__":
+    test_load_generator()
+    test_failed_requests_counted()
+    test_invalid_rates_rejected()
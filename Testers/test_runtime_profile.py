@@ -0,0 +1,83 @@
+import sys
+import os
+import shutil
+import tempfile
+
+# 1. Setup Path to C++ Module
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+build_dir = os.path.join(project_root, 'build')
+sys.path.append(build_dir)
+
+try:
+    import audioguard_core
+    print(f" SUCCESS: Imported C++ Module")
+except ImportError as e:
+    print(f" FAILED to import module: {e}")
+    sys.exit(1)
+
+def test_runtime_profile():
+    print("\n--- Testing RuntimeProfile Round Trip ---")
+
+    # Later engines in the same process read $AUDIOGUARD_PROFILE, so restore it
+    saved_env = os.environ.get("AUDIOGUARD_PROFILE")
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        # A. Defaults when no profile is configured
+        os.environ.pop("AUDIOGUARD_PROFILE", None)
+        default = audioguard_core.RuntimeProfile.from_env()
+        assert default.intra_op_threads == 0 and default.batch_size == 1, \
+            "Unexpected defaults without AUDIOGUARD_PROFILE."
+
+        # B. Write a profile the way autotune.py does
+        profile = audioguard_core.RuntimeProfile()
+        profile.intra_op_threads = 4
+        profile.inter_op_threads = 1
+        profile.dsp_workers = 2
+        profile.batch_size = 8
+        profile.instance_count = 2
+
+        path = os.path.join(tmp_dir, "audioguard_profile.cfg")
+        profile.save(path)
+        print(f"Saved profile to: {path}")
+
+        # C. Load it back, both directly and through the environment
+        os.environ["AUDIOGUARD_PROFILE"] = path
+        for loaded in (audioguard_core.RuntimeProfile.load(path),
+                       audioguard_core.RuntimeProfile.from_env()):
+            fields = ("intra_op_threads", "inter_op_threads", "dsp_workers",
+                      "batch_size", "instance_count")
+            mismatched = [f for f in fields if getattr(loaded, f) != getattr(profile, f)]
+            assert not mismatched, f"Fields differ after reload: {mismatched}"
+
+        # D. Malformed or out-of-range values must be rejected, not silently defaulted
+        for bad_line in ("batch_size = eight", "batch_size = 0",
+                         "dsp_workers = 0", "instance_count = 0", "intra_op_threads = -1"):
+            profile.save(path)
+            with open(path, "a") as f:
+                f.write(bad_line + "\n")
+            try:
+                audioguard_core.RuntimeProfile.load(path)
+            except RuntimeError as e:
+                print(f"Rejected '{bad_line}': {e}")
+            else:
+                assert False, f"Malformed profile was accepted: '{bad_line}'"
+
+        # E. Zero still means "let ORT decide" for the thread counts
+        profile.save(path)
+        with open(path, "a") as f:
+            f.write("intra_op_threads = 0\ninter_op_threads = 0\n")
+        loaded = audioguard_core.RuntimeProfile.load(path)
+        assert loaded.intra_op_threads == 0 and loaded.inter_op_threads == 0, \
+            "Zero ORT thread counts were not accepted."
+    finally:
+        if saved_env is None:
+            os.environ.pop("AUDIOGUARD_PROFILE", None)
+        else:
+            os.environ["AUDIOGUARD_PROFILE"] = saved_env
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print(" PASSED: RuntimeProfile loads what it saves!")
+
+if __name__ == "__main__":
+    test_runtime_profile()
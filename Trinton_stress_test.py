@@ -2,6 +2,8 @@ import os
 import glob
 import sys
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import tritonclient.http as httpclient
 
@@ -29,6 +31,15 @@ OUTPUT_NAME = "dense_1"
 
 LABELS = ["down", "go", "left", "no", "off", "on", "right", "stop", "up", "yes"]
 
+# One Preprocessor per DSP worker thread
+_local = threading.local()
+
+def load_and_process(file_path):
+    if not hasattr(_local, "preprocessor"):
+        _local.preprocessor = audioguard_core.Preprocessor()
+    raw_audio = audioguard_core.AudioLoader.load_audio(file_path)
+    return _local.preprocessor.process(raw_audio)
+
 def run_ultimate_benchmark():
     # -----------------------------------------------------
     # SETUP
@@ -43,11 +54,15 @@ def run_ultimate_benchmark():
         print(f"❌ Connection Failed: {e}")
         return
 
+    # Tuned per-host settings from autotune.py (defaults if AUDIOGUARD_PROFILE is unset)
     try:
-        preprocessor = audioguard_core.Preprocessor()
+        profile = audioguard_core.RuntimeProfile.from_env()
+        dsp_pool = ThreadPoolExecutor(max_workers=profile.dsp_workers)
     except Exception as e:
         print(f"❌ Failed to init C++ classes: {e}")
         return
+    batch_size = profile.batch_size
+    print(f"⚙️  Runtime profile: dsp_workers={profile.dsp_workers}, batch_size={batch_size}")
 
     # -----------------------------------------------------
     # 🔥 WARMUP PHASE (Clear Cold Start Spikes)
@@ -83,22 +98,22 @@ def run_ultimate_benchmark():
 
         files = glob.glob(os.path.join(folder_path, "*.wav"))[:1000]
 
-        for file_path in files:
-            filename = os.path.basename(file_path)
+        for b in range(0, len(files), batch_size):
+            batch_files = files[b:b + batch_size]
+            n = len(batch_files)
 
             try:
-                # --- PHASE 1: C++ LOADING & DSP ---
+                # --- PHASE 1: C++ LOADING & DSP (parallel across dsp_workers) ---
                 t0 = time.time()
-                raw_audio = audioguard_core.AudioLoader.load_audio(file_path)
-                flat_features = preprocessor.process(raw_audio)
+                flat_features = list(dsp_pool.map(load_and_process, batch_files))
                 t1 = time.time()
-                
-                dsp_time = (t1 - t0) * 1000
-                accum_dsp_time += dsp_time
+
+                # Batch cost is shared evenly across its files
+                dsp_time = (t1 - t0) * 1000 / n
 
                 # --- PHASE 2: RESHAPE ---
                 features_np = np.array(flat_features, dtype=np.float32)
-                input_tensor = features_np.reshape(1, 30, 40, 1)
+                input_tensor = features_np.reshape(n, 30, 40, 1)
 
                 # --- PHASE 3: TRITON INFERENCE ---
                 inputs = [httpclient.InferInput(INPUT_NAME, input_tensor.shape, "FP32")]
@@ -109,11 +124,19 @@ def run_ultimate_benchmark():
                 res = client.infer(model_name=MODEL_NAME, inputs=inputs, outputs=outputs)
                 t3 = time.time()
                 
-                inf_time = (t3 - t2) * 1000
-                accum_inf_time += inf_time
+                inf_time = (t3 - t2) * 1000 / n
 
                 # --- DECODE RESULTS ---
-                logits = res.as_numpy(OUTPUT_NAME)[0]
+                batch_logits = res.as_numpy(OUTPUT_NAME)
+            except Exception as e:
+                print(f"\nError processing batch starting at {os.path.basename(batch_files[0])}: {e}")
+                continue
+
+            accum_dsp_time += dsp_time * n
+            accum_inf_time += inf_time * n
+
+            for file_path, logits in zip(batch_files, batch_logits):
+                filename = os.path.basename(file_path)
                 pred_idx = np.argmax(logits)
                 pred_label = LABELS[pred_idx]
                 
@@ -129,9 +152,6 @@ def run_ultimate_benchmark():
 
                 print(f"{true_label:<8} | {filename[:20]:<20} | {pred_label:<8} | {confidence:5.1f}% | {dsp_time:8.3f} | {inf_time:8.3f} | {total_req_time:8.3f} | {status}")
 
-            except Exception as e:
-                print(f"\nError processing {filename}: {e}")
-
     # -----------------------------------------------------
     # FINAL REPORT
     # -----------------------------------------------------
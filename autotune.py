@@ -0,0 +1,304 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ---------------------------------------------------------
+# 1. CONFIGURATION
+# ---------------------------------------------------------
+project_root = os.path.dirname(os.path.abspath(__file__))
+
+MODEL_PATH = os.path.join(project_root, "model_lab", "model.onnx")
+BASE_CONFIG_PATH = os.path.join(project_root, "model_repository", "audioguard", "config.pbtxt")
+PROFILE_PATH = "audioguard_profile.cfg"
+CONFIG_VARIANT_PATH = "config.tuned.pbtxt"
+
+FEATURE_SHAPE = [30, 40, 1]
+SAMPLE_RATE = 16000
+
+# Default search space. Thread counts are clipped to the host's core count;
+# instance counts are not, since they map to a KIND_GPU instance_group.
+DSP_WORKERS = [1, 2, 4]
+INTRA_OP_THREADS = [1, 2, 4]
+INTER_OP_THREADS = [1]
+BATCH_SIZES = [1, 2, 4, 8]
+INSTANCE_COUNTS = [1, 2]
+
+
+def import_core():
+    # Only the measurement needs the C++ module; the search/report helpers run without it
+    sys.path.append(os.getcwd())
+    sys.path.append(os.path.join(project_root, 'build'))
+    try:
+        import audioguard_core
+        print("✅ C++ Core Module (audioguard_core) Loaded!")
+        return audioguard_core
+    except ImportError as e:
+        print(f"❌ Failed to load audioguard_core: {e}")
+        print("Ensure audioguard_core.so is in the current directory or build/.")
+        exit(1)
+
+
+def parse_int_list(text):
+    return sorted({int(v) for v in text.split(",") if v.strip()})
+
+
+def build_search_space(args):
+    cores = os.cpu_count() or 1
+    clip = lambda values: sorted({min(v, cores) for v in values if v > 0})
+    grid = itertools.product(
+        clip(args.dsp_workers),
+        clip(args.intra_op_threads),
+        clip(args.inter_op_threads),
+        sorted({b for b in args.batch_sizes if b > 0}),
+        sorted({n for n in args.instance_counts if n > 0}),
+    )
+    return [
+        dict(dsp_workers=d, intra_op_threads=intra, inter_op_threads=inter,
+             batch_size=b, instance_count=n)
+        for d, intra, inter, b, n in grid
+    ]
+
+
+def make_profile(core, knobs):
+    profile = core.RuntimeProfile()
+    for key, value in knobs.items():
+        setattr(profile, key, value)
+    return profile
+
+
+def make_synthetic_audio(n_clips, seed=42):
+    # 1 second clips of low-level noise; the DSP cost does not depend on content
+    rng = random.Random(seed)
+    return [[rng.uniform(-0.5, 0.5) for _ in range(SAMPLE_RATE)]
+            for _ in range(n_clips)]
+
+
+def percentile(sorted_values, q):
+    # Nearest-rank percentile on an already sorted list
+    rank = max(1, int(-(-q * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+# ---------------------------------------------------------
+# 2. MEASUREMENT
+# ---------------------------------------------------------
+def measure(core, model_path, knobs, audio_pool, n_requests, warmup_batches=3):
+    """Runs the synthetic workload under one knob setting.
+
+    Each instance is a separate InferenceEngine session driven by its own
+    thread (the local analogue of a Triton instance_group). Batches are
+    preprocessed on a shared DSP pool and then run as one predict() call.
+    Every request in a batch is charged the batch's wall time.
+    """
+    profile = make_profile(core, knobs)
+    batch_size = knobs["batch_size"]
+    engines = [core.InferenceEngine(model_path, profile)
+               for _ in range(knobs["instance_count"])]
+
+    local = threading.local()
+
+    def dsp(clip):
+        if not hasattr(local, "preprocessor"):
+            local.preprocessor = core.Preprocessor()
+        return local.preprocessor.process(clip)
+
+    n_batches = max(1, n_requests // batch_size)
+    next_batch = itertools.count()
+    latencies = []
+    lock = threading.Lock()
+
+    with ThreadPoolExecutor(max_workers=knobs["dsp_workers"]) as dsp_pool:
+
+        def run_batch(engine, batch_idx):
+            start = batch_idx * batch_size
+            clips = [audio_pool[(start + i) % len(audio_pool)] for i in range(batch_size)]
+            features = list(dsp_pool.map(dsp, clips))
+            flat = [v for f in features for v in f]
+            engine.predict(flat, [batch_size] + FEATURE_SHAPE)
+
+        def instance_loop(engine):
+            while True:
+                idx = next(next_batch)
+                if idx >= n_batches:
+                    return
+                t0 = time.perf_counter()
+                run_batch(engine, idx)
+                elapsed_ms = (time.perf_counter() - t0) * 1000
+                with lock:
+                    latencies.extend([elapsed_ms] * batch_size)
+
+        # Warmup every engine (and the DSP pool threads) before the clock starts,
+        # so cold-start work never lands inside the timed window
+        for engine in engines:
+            for i in range(warmup_batches):
+                run_batch(engine, i)
+
+        t_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(engines)) as instance_pool:
+            list(instance_pool.map(instance_loop, engines))
+        wall = time.perf_counter() - t_start
+
+    lat = sorted(latencies)
+    return dict(
+        knobs,
+        requests=len(lat),
+        throughput=len(lat) / wall,
+        p50_ms=percentile(lat, 50),
+        p99_ms=percentile(lat, 99),
+    )
+
+
+def pareto_front(results):
+    """Returns the results not dominated on (higher throughput, lower p99)."""
+    front = []
+    best_p99 = float("inf")
+    for r in sorted(results, key=lambda r: (-r["throughput"], r["p99_ms"])):
+        if r["p99_ms"] < best_p99:
+            front.append(r)
+            best_p99 = r["p99_ms"]
+    return front
+
+
+def choose_operating_point(front, p99_budget_ms=None):
+    # Highest throughput that fits the latency budget; lowest p99 if none does
+    if p99_budget_ms is not None:
+        within = [r for r in front if r["p99_ms"] <= p99_budget_ms]
+        if within:
+            return max(within, key=lambda r: r["throughput"])
+        return min(front, key=lambda r: r["p99_ms"])
+    return max(front, key=lambda r: r["throughput"])
+
+
+# ---------------------------------------------------------
+# 3. OUTPUTS
+# ---------------------------------------------------------
+def render_triton_config(base_text, knobs, queue_delay_us):
+    """Derives a config.pbtxt variant from the deployed one.
+
+    Keeps name, platform, I/O and instance kind; rewrites max_batch_size and
+    instance_group count, and adds dynamic batching plus ORT thread settings.
+    """
+    text = re.sub(r"max_batch_size:\s*\d+",
+                  f"max_batch_size: {knobs['batch_size']}", base_text)
+    text = re.sub(r"(instance_group\s*\[\s*\{[^}]*?count:\s*)\d+",
+                  rf"\g<1>{knobs['instance_count']}", text)
+    text = re.sub(r"\n*dynamic_batching\s*\{[^}]*\}", "", text)
+    text = re.sub(r"\n*parameters\s*\{[^{}]*\{[^{}]*\}[^{}]*\}", "", text)
+    text = text.replace("# Tuned by autotune.py", "")
+
+    text = text.rstrip() + "\n\n# Tuned by autotune.py\n"
+    if knobs["batch_size"] > 1:
+        text += (
+            "dynamic_batching {\n"
+            f"  preferred_batch_size: [ {knobs['batch_size']} ]\n"
+            f"  max_queue_delay_microseconds: {queue_delay_us}\n"
+            "}\n"
+        )
+    for key, value in (("intra_op_thread_count", knobs["intra_op_threads"]),
+                       ("inter_op_thread_count", knobs["inter_op_threads"])):
+        text += (
+            "parameters {\n"
+            f"  key: \"{key}\"\n"
+            f"  value: {{ string_value: \"{value}\" }}\n"
+            "}\n"
+        )
+    return text
+
+
+def print_results(results, front):
+    on_front = {id(r) for r in front}
+    print("=" * 92)
+    print(f"{'DSP':>4} | {'INTRA':>5} | {'INTER':>5} | {'BATCH':>5} | {'INST':>4} | "
+          f"{'REQ/S':>9} | {'P50(ms)':>8} | {'P99(ms)':>8} | {'PARETO'}")
+    print("-" * 92)
+    for r in sorted(results, key=lambda r: -r["throughput"]):
+        mark = "★" if id(r) in on_front else ""
+        print(f"{r['dsp_workers']:>4} | {r['intra_op_threads']:>5} | {r['inter_op_threads']:>5} | "
+              f"{r['batch_size']:>5} | {r['instance_count']:>4} | {r['throughput']:9.1f} | "
+              f"{r['p50_ms']:8.3f} | {r['p99_ms']:8.3f} | {mark}")
+    print("=" * 92)
+
+
+def run_autotune(args):
+    core = import_core()
+    space = build_search_space(args)
+    audio_pool = make_synthetic_audio(args.clips)
+    print(f"🔧 Sweeping {len(space)} configurations ({args.requests} requests each)...\n")
+
+    results = []
+    for i, knobs in enumerate(space, 1):
+        try:
+            r = measure(core, args.model, knobs, audio_pool, args.requests)
+        except Exception as e:
+            # e.g. a model exported without a dynamic batch dimension
+            print(f"[{i}/{len(space)}] {knobs} ❌ {e}")
+            continue
+        print(f"[{i}/{len(space)}] {knobs} -> {r['throughput']:.1f} req/s, p99 {r['p99_ms']:.3f} ms")
+        results.append(r)
+
+    if not results:
+        print("❌ No configuration completed.")
+        return 1
+
+    front = pareto_front(results)
+    print_results(results, front)
+
+    best = choose_operating_point(front, args.p99_budget_ms)
+    knobs = {k: best[k] for k in space[0]}
+    make_profile(core, knobs).save(args.profile)
+
+    with open(BASE_CONFIG_PATH) as f:
+        base_config = f.read()
+    with open(args.config_out, "w") as f:
+        f.write(render_triton_config(base_config, knobs, args.queue_delay_us))
+
+    print(f"🏁 Operating point: {knobs}")
+    print(f"   {best['throughput']:.1f} req/s, p50 {best['p50_ms']:.3f} ms, p99 {best['p99_ms']:.3f} ms")
+    print(f"💾 Profile:       {args.profile}  (load via AUDIOGUARD_PROFILE={args.profile})")
+    print(f"💾 Triton config: {args.config_out}")
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tune DSP/ORT/batching knobs for this host.")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--requests", type=int, default=512, help="Timed requests per configuration")
+    parser.add_argument("--clips", type=int, default=64, help="Synthetic audio clips to cycle through")
+    parser.add_argument("--dsp-workers", type=parse_int_list, default=DSP_WORKERS)
+    parser.add_argument("--intra-op-threads", type=parse_int_list, default=INTRA_OP_THREADS)
+    parser.add_argument("--inter-op-threads", type=parse_int_list, default=INTER_OP_THREADS)
+    parser.add_argument("--batch-sizes", type=parse_int_list, default=BATCH_SIZES)
+    parser.add_argument("--instance-counts", type=parse_int_list, default=INSTANCE_COUNTS)
+    parser.add_argument("--p99-budget-ms", type=float, default=None,
+                        help="Pick the fastest Pareto point under this p99 (default: fastest overall)")
+    parser.add_argument("--queue-delay-us", type=int, default=100,
+                        help="max_queue_delay_microseconds for the Triton variant")
+    parser.add_argument("--profile", default=PROFILE_PATH)
+    parser.add_argument("--config-out", default=CONFIG_VARIANT_PATH)
+    args = parser.parse_args(argv)
+
+    # Reject an empty or invalid search space before any engine is built
+    if args.requests < 1:
+        parser.error(f"--requests must be >= 1, got {args.requests}")
+    if args.clips < 1:
+        parser.error(f"--clips must be >= 1, got {args.clips}")
+    for flag, values in (("--dsp-workers", args.dsp_workers),
+                         ("--intra-op-threads", args.intra_op_threads),
+                         ("--inter-op-threads", args.inter_op_threads),
+                         ("--batch-sizes", args.batch_sizes),
+                         ("--instance-counts", args.instance_counts)):
+        if not values:
+            parser.error(f"{flag} needs at least one value")
+        if min(values) < 1:
+            parser.error(f"{flag} values must be >= 1, got {min(values)}")
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(run_autotune(parse_args()))
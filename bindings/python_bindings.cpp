@@ -3,6 +3,7 @@
 #include "audioguard/Preprocessor.h"
 #include "audioguard/AudioLoader.h"
 #include "audioguard/InferenceEngine.h"
+#include "audioguard/RuntimeProfile.h"
 
 namespace py = pybind11;
 
@@ -10,18 +11,38 @@ PYBIND11_MODULE(audioguard_core, m) {
     m.doc() = "AudioGuard C++ Core Module";
 
     // Expose Preprocessor 
+    // GIL is released so DSP workers on Python threads run in parallel
     py::class_<audioguard::Preprocessor>(m, "Preprocessor")
         .def(py::init<>())
-        .def("process", &audioguard::Preprocessor::process);
+        .def("process", &audioguard::Preprocessor::process,
+             py::call_guard<py::gil_scoped_release>());
 
     // Expose AudioLoade
     py::class_<audioguard::AudioLoader>(m, "AudioLoader")
         .def_static("load_audio", &audioguard::AudioLoader::load_audio, 
                     "Loads audio file, resamples to 16kHz Mono, returns float list.");
+    // Expose RuntimeProfile
+    py::class_<audioguard::RuntimeProfile>(m, "RuntimeProfile")
+        .def(py::init<>())
+        .def_readwrite("intra_op_threads", &audioguard::RuntimeProfile::intra_op_threads)
+        .def_readwrite("inter_op_threads", &audioguard::RuntimeProfile::inter_op_threads)
+        .def_readwrite("dsp_workers", &audioguard::RuntimeProfile::dsp_workers)
+        .def_readwrite("batch_size", &audioguard::RuntimeProfile::batch_size)
+        .def_readwrite("instance_count", &audioguard::RuntimeProfile::instance_count)
+        .def_static("load", &audioguard::RuntimeProfile::load,
+                    "Load a tuned profile file written by autotune.py.")
+        .def_static("from_env", &audioguard::RuntimeProfile::from_env,
+                    "Load the profile named by $AUDIOGUARD_PROFILE, or defaults if unset.")
+        .def("save", &audioguard::RuntimeProfile::save);
+
     // Expose InferenceEngine 
     py::class_<audioguard::InferenceEngine>(m, "InferenceEngine")
         .def(py::init<const std::string&>(), "Load model from path")
+        .def(py::init<const std::string&, const audioguard::RuntimeProfile&>(),
+             "Load model from path with a tuned runtime profile",
+             py::arg("model_path"), py::arg("profile"))
         .def("predict", &audioguard::InferenceEngine::predict, 
              "Run inference on input vector",
-             py::arg("input_data"), py::arg("input_shape"));
+             py::arg("input_data"), py::arg("input_shape"),
+             py::call_guard<py::gil_scoped_release>());
 }
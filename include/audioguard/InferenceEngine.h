@@ -4,13 +4,17 @@
 #include <vector>
 #include <string>
 #include <memory> // For std::unique_ptr
+#include "audioguard/RuntimeProfile.h"
 
 namespace audioguard {
 
 class InferenceEngine {
 public:
-    // Constructor loads the model from disk
+    // Constructor loads the model from disk, using $AUDIOGUARD_PROFILE if set
     explicit InferenceEngine(const std::string& model_path);
+
+    // Constructor with explicit session threading (see RuntimeProfile)
+    InferenceEngine(const std::string& model_path, const RuntimeProfile& profile);
     
     // Destructor must be defined in .cpp where Impl is complete
     ~InferenceEngine();
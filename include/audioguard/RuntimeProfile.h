@@ -0,0 +1,45 @@
+#ifndef AUDIOGUARD_RUNTIMEPROFILE_H
+#define AUDIOGUARD_RUNTIMEPROFILE_H
+
+#include <string>
+#include <stdexcept>
+
+namespace audioguard {
+
+// Environment variable checked at startup for a tuned profile file.
+constexpr const char* PROFILE_ENV_VAR = "AUDIOGUARD_PROFILE";
+
+struct RuntimeProfile {
+    // ONNX Runtime session threads (0 = let ORT decide)
+    int intra_op_threads = 0;
+    int inter_op_threads = 0;
+
+    // Host-side pipeline knobs, read by Trinton_stress_test.py
+    int dsp_workers = 1;   // DSP thread pool size
+    int batch_size = 1;    // files per Triton request
+
+    // Server-side: mirrors the instance_group count in the tuned config.pbtxt
+    int instance_count = 1;
+
+    /**
+     * Loads a profile written by autotune.py.
+     * Format: one "key = value" per line, '#' starts a comment.
+     * Unknown keys are ignored so older binaries can read newer profiles.
+     * * @param filepath Path to the profile file.
+     * @throws std::runtime_error If the file cannot be opened or a value is malformed.
+     */
+    static RuntimeProfile load(const std::string& filepath);
+
+    /**
+     * Loads the profile named by $AUDIOGUARD_PROFILE.
+     * @return Default profile when the variable is unset or empty.
+     */
+    static RuntimeProfile from_env();
+
+    // Writes the profile in the same format load() reads.
+    void save(const std::string& filepath) const;
+};
+
+} // namespace audioguard
+
+#endif // AUDIOGUARD_RUNTIMEPROFILE_H
@@ -0,0 +1,440 @@
+import os
+import sys
+import csv
+import glob
+import json
+import time
+import random
+import argparse
+import threading
+import http.client
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ---------------------------------------------------------
+# 1. CONFIGURATION
+# ---------------------------------------------------------
+project_root = os.path.dirname(os.path.abspath(__file__))
+
+SERVER_URL = "localhost:8000"
+MODEL_NAME = "audioguard"
+INPUT_NAME = "input_spectrogram"
+OUTPUT_NAME = "dense_1"
+MODEL_PATH = os.path.join(project_root, "model_lab", "model.onnx")
+
+FEATURE_SHAPE = [1, 30, 40, 1]
+NUM_CLASSES = 10
+
+
+def import_core():
+    # Only the in-process targets need the C++ module; http/stub run without it
+    sys.path.append(os.getcwd())
+    sys.path.append(os.path.join(project_root, 'build'))
+    try:
+        import audioguard_core
+        print("✅ C++ Core Module (audioguard_core) Loaded!")
+        return audioguard_core
+    except ImportError as e:
+        print(f"❌ Failed to load audioguard_core: {e}")
+        print("Ensure audioguard_core.so is in the current directory or build/.")
+        exit(1)
+
+
+def synthetic_features(seed=42):
+    rng = random.Random(seed)
+    size = 1
+    for d in FEATURE_SHAPE:
+        size *= d
+    return [rng.gauss(0.0, 1.0) for _ in range(size)]
+
+
+# ---------------------------------------------------------
+# 2. TARGETS
+# ---------------------------------------------------------
+# A target is a zero-argument callable that performs one request and raises
+# on failure. Targets are called concurrently from worker threads.
+
+def make_engine_target(model_path):
+    core = import_core()
+    engine = core.InferenceEngine(model_path)
+    features = synthetic_features()
+
+    def request():
+        engine.predict(features, FEATURE_SHAPE)
+    return request
+
+
+def make_pipeline_target(model_path, audio_dir):
+    core = import_core()
+    engine = core.InferenceEngine(model_path)
+    files = [f for f in glob.glob(os.path.join(audio_dir, "**", "*.wav"), recursive=True)
+             if not os.path.basename(f).startswith("._")]
+    if not files:
+        raise FileNotFoundError(f"No .wav files found under {audio_dir}")
+
+    local = threading.local()
+    counter = iter(range(sys.maxsize))
+    lock = threading.Lock()
+
+    def request():
+        if not hasattr(local, "preprocessor"):
+            local.preprocessor = core.Preprocessor()
+        with lock:
+            path = files[next(counter) % len(files)]
+        raw_audio = core.AudioLoader.load_audio(path)
+        features = local.preprocessor.process(raw_audio)
+        engine.predict(features, FEATURE_SHAPE)
+    return request
+
+
+def make_http_target(url, model_name, timeout=10.0):
+    """KServe v2 JSON inference, one keep-alive connection per worker thread."""
+    parsed = urlparse(url if "://" in url else f"http://{url}")
+    host, port = parsed.hostname, parsed.port or 80
+    path = f"/v2/models/{model_name}/infer"
+    body = json.dumps({
+        "inputs": [{
+            "name": INPUT_NAME,
+            "shape": FEATURE_SHAPE,
+            "datatype": "FP32",
+            "data": synthetic_features(),
+        }],
+        "outputs": [{"name": OUTPUT_NAME}],
+    }).encode()
+    headers = {"Content-Type": "application/json"}
+    local = threading.local()
+
+    def request():
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        try:
+            local.conn.request("POST", path, body=body, headers=headers)
+            resp = local.conn.getresponse()
+            payload = resp.read()
+        except Exception:
+            # Drop the broken connection so the next request reconnects
+            local.conn.close()
+            del local.conn
+            raise
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}: {payload[:200]!r}")
+    return request
+
+
+# ---------------------------------------------------------
+# 3. STUB KSERVE-V2 SERVER
+# ---------------------------------------------------------
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+    latency_ms = 1.0
+    jitter = "fixed"
+    error_rate = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path in ("/v2/health/live", "/v2/health/ready"):
+            self._reply(200, {})
+        else:
+            self._reply(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 4 or parts[:2] != ["v2", "models"] or parts[3] != "infer":
+            self._reply(404, {"error": f"unknown path {self.path}"})
+            return
+
+        service_ms = self.latency_ms
+        if self.jitter == "exponential":
+            service_ms = random.expovariate(1.0 / self.latency_ms) if self.latency_ms > 0 else 0.0
+        time.sleep(service_ms / 1000)
+
+        if random.random() < self.error_rate:
+            self._reply(500, {"error": "injected failure"})
+            return
+
+        batch = request.get("inputs", [{}])[0].get("shape", [1])[0]
+        self._reply(200, {
+            "model_name": parts[2],
+            "outputs": [{
+                "name": OUTPUT_NAME,
+                "shape": [batch, NUM_CLASSES],
+                "datatype": "FP32",
+                "data": [0.0] * (batch * NUM_CLASSES),
+            }],
+        })
+
+
+def start_stub_server(port=0, latency_ms=1.0, jitter="fixed", error_rate=0.0):
+    """Starts the stub on a daemon thread. Returns (server, "host:port")."""
+    handler = type("ConfiguredStubHandler", (StubHandler,), dict(
+        latency_ms=latency_ms, jitter=jitter, error_rate=error_rate))
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, bound_port = server.server_address
+    return server, f"{host}:{bound_port}"
+
+
+# ---------------------------------------------------------
+# 4. OPEN-LOOP DRIVER
+# ---------------------------------------------------------
+def percentile(sorted_values, q):
+    # Nearest-rank percentile on an already sorted list
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, int(-(-q * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def arrival_schedule(rate, duration, arrival, seed=0):
+    """Intended send offsets (seconds from start) for one run."""
+    if rate <= 0:
+        raise ValueError(f"rate must be > 0 req/s, got {rate}")
+    rng = random.Random(seed)
+    offsets = []
+    t = 0.0
+    while True:
+        t += rng.expovariate(rate) if arrival == "poisson" else 1.0 / rate
+        if t >= duration:
+            return offsets
+        offsets.append(t)
+
+
+def run_open_loop(target, rate, duration, arrival="poisson", max_workers=64, seed=0):
+    """Drives `target` at `rate` req/s for `duration` seconds without waiting on replies.
+
+    Latency is measured from each request's *intended* send time, so time
+    spent queued behind a slow server (or a late dispatcher) is counted
+    instead of silently omitted (coordinated-omission correction).
+    Service time is measured from the moment a worker actually started it.
+    Failed requests (including timeouts) are kept in an error-inclusive
+    latency set, so the tail is not understated near saturation.
+    """
+    if rate <= 0:
+        raise ValueError(f"rate must be > 0 req/s, got {rate}")
+    latencies, all_latencies, service_times = [], [], []
+    errors = []
+    lock = threading.Lock()
+
+    def job(intended):
+        started = time.perf_counter()
+        try:
+            target()
+            ok = True
+        except Exception as e:
+            ok = False
+            err = str(e)
+        finished = time.perf_counter()
+        with lock:
+            all_latencies.append((finished - intended) * 1000)
+            if ok:
+                latencies.append((finished - intended) * 1000)
+                service_times.append((finished - started) * 1000)
+            else:
+                errors.append(err)
+
+    offsets = arrival_schedule(rate, duration, arrival, seed)
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    t_start = time.perf_counter()
+    for offset in offsets:
+        intended = t_start + offset
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        pool.submit(job, intended)
+    pool.shutdown(wait=True)
+    elapsed = time.perf_counter() - t_start
+
+    latencies.sort()
+    all_latencies.sort()
+    service_times.sort()
+    sent = len(offsets)
+    return {
+        "offered_rps": rate,
+        "arrival": arrival,
+        "sent": sent,
+        # What the schedule actually produced (Poisson runs vary around `rate`)
+        "sent_rps": sent / duration,
+        "ok": len(latencies),
+        "errors": len(errors),
+        "error_rate": len(errors) / sent if sent else 0.0,
+        "achieved_rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "p999_ms": percentile(latencies, 99.9),
+        "max_ms": latencies[-1] if latencies else float("nan"),
+        # Same percentiles over every request, failures included
+        "p99_all_ms": percentile(all_latencies, 99),
+        "p999_all_ms": percentile(all_latencies, 99.9),
+        "service_p99_ms": percentile(service_times, 99),
+        "first_error": errors[0] if errors else "",
+    }
+
+
+def find_saturation(curve, slo_ms=None, tolerance=0.95):
+    """First offered rate the target can no longer keep up with (or meet the SLO at)."""
+    for point in curve:
+        if point["achieved_rps"] < tolerance * point["sent_rps"]:
+            return point
+        if point["error_rate"] > 0.01:
+            return point
+        if slo_ms is not None and point["p99_all_ms"] > slo_ms:
+            return point
+    return None
+
+
+# ---------------------------------------------------------
+# 5. REPORTING
+# ---------------------------------------------------------
+def print_curve(curve):
+    # P50..MAX cover successful requests; P99 ALL includes failures and timeouts
+    print("=" * 116)
+    print(f"{'OFFERED':>8} | {'ACHIEVED':>8} | {'SENT':>7} | {'ERR%':>6} | {'P50(ms)':>8} | "
+          f"{'P99(ms)':>8} | {'P99.9(ms)':>9} | {'MAX(ms)':>8} | {'P99 ALL':>8} | {'SVC P99':>8}")
+    print("-" * 116)
+    for p in curve:
+        print(f"{p['offered_rps']:8.1f} | {p['achieved_rps']:8.1f} | {p['sent']:7d} | "
+              f"{p['error_rate'] * 100:6.2f} | {p['p50_ms']:8.3f} | {p['p99_ms']:8.3f} | "
+              f"{p['p999_ms']:9.3f} | {p['max_ms']:8.3f} | {p['p99_all_ms']:8.3f} | "
+              f"{p['service_p99_ms']:8.3f}")
+    print("=" * 116)
+
+
+def write_curve(curve, json_path=None, csv_path=None):
+    if not curve:
+        print("⚠️  No load points measured; nothing to write.")
+        return
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(curve, f, indent=2)
+        print(f"💾 Curve (JSON): {json_path}")
+    if csv_path:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(curve[0].keys()))
+            writer.writeheader()
+            writer.writerows(curve)
+        print(f"💾 Curve (CSV):  {csv_path}")
+
+
+def build_target(args):
+    if args.target == "engine":
+        return make_engine_target(args.model_path)
+    if args.target == "pipeline":
+        if not args.audio_dir:
+            raise SystemExit("--audio-dir is required for the pipeline target")
+        return make_pipeline_target(args.model_path, args.audio_dir)
+    return make_http_target(args.url, args.model_name)
+
+
+def run_load_test(args):
+    if args.with_stub:
+        _, args.url = start_stub_server(latency_ms=args.stub_latency_ms, jitter=args.stub_jitter,
+                                        error_rate=args.stub_error_rate)
+        print(f"🧪 Stub KServe-v2 server listening on {args.url}")
+
+    target = build_target(args)
+
+    # Warmup: clears cold-start spikes before the timed runs
+    print("🔥 Warming up target...")
+    warmup_errors = 0
+    for _ in range(args.warmup):
+        try:
+            target()
+        except Exception as e:
+            # Failures are part of what we measure; only give up if nothing succeeds
+            warmup_errors += 1
+            last_error = e
+    if args.warmup and warmup_errors == args.warmup:
+        print(f"❌ Every warmup request failed: {last_error}")
+        return 1
+    print(f"✅ Warmup complete ({warmup_errors} errors).\n")
+
+    curve = []
+    for rate in args.rates:
+        print(f"🚀 {args.target}: {rate:.1f} req/s ({args.arrival}) for {args.duration:.1f}s...")
+        curve.append(run_open_loop(target, rate, args.duration, args.arrival,
+                                   max_workers=args.max_workers, seed=args.seed))
+        if curve[-1]["first_error"]:
+            print(f"   ⚠️  {curve[-1]['errors']} errors, first: {curve[-1]['first_error']}")
+
+    print_curve(curve)
+    saturation = find_saturation(curve, args.slo_ms)
+    if saturation:
+        print(f"📉 Saturation at ~{saturation['offered_rps']:.1f} req/s offered "
+              f"(achieved {saturation['achieved_rps']:.1f}, p99 incl. errors {saturation['p99_all_ms']:.3f} ms)")
+    else:
+        print("📈 No saturation within the offered rates.")
+    write_curve(curve, args.json, args.csv)
+    return 0
+
+
+def parse_rates(text):
+    try:
+        rates = sorted(float(v) for v in text.split(",") if v.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"rates must be numbers, got '{text}'")
+    if not rates:
+        raise argparse.ArgumentTypeError("at least one rate is required")
+    if rates[0] <= 0:
+        raise argparse.ArgumentTypeError(f"rates must be > 0 req/s, got {rates[0]:g}")
+    return rates
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Open-loop load generator with tail-latency reporting.")
+    parser.add_argument("--target", choices=["engine", "pipeline", "http"], default="http")
+    parser.add_argument("--rates", type=parse_rates, default=[50.0, 100.0, 200.0, 400.0],
+                        help="Comma-separated offered loads in req/s")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per offered load")
+    parser.add_argument("--arrival", choices=["poisson", "fixed"], default="poisson")
+    parser.add_argument("--max-workers", type=int, default=64, help="Concurrent in-flight requests")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--slo-ms", type=float, default=None, help="p99 SLO used to locate saturation")
+    parser.add_argument("--model-path", default=MODEL_PATH)
+    parser.add_argument("--audio-dir", default=None, help="Directory of .wav files (pipeline target)")
+    parser.add_argument("--url", default=SERVER_URL)
+    parser.add_argument("--model-name", default=MODEL_NAME)
+    parser.add_argument("--json", default=None, help="Write the latency-vs-load curve as JSON")
+    parser.add_argument("--csv", default=None, help="Write the latency-vs-load curve as CSV")
+
+    stub = parser.add_argument_group("stub server")
+    stub.add_argument("--serve-stub", action="store_true", help="Only run the stub server on --stub-port")
+    stub.add_argument("--with-stub", action="store_true", help="Start a local stub and target it over HTTP")
+    stub.add_argument("--stub-port", type=int, default=8000)
+    stub.add_argument("--stub-latency-ms", type=float, default=1.0)
+    stub.add_argument("--stub-jitter", choices=["fixed", "exponential"], default="fixed")
+    stub.add_argument("--stub-error-rate", type=float, default=0.0)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.serve_stub:
+        server, address = start_stub_server(args.stub_port, args.stub_latency_ms,
+                                            args.stub_jitter, args.stub_error_rate)
+        print(f"🧪 Stub KServe-v2 server listening on {address} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            server.shutdown()
+    else:
+        if args.with_stub:
+            args.target = "http"
+        sys.exit(run_load_test(args))
@@ -7,6 +7,24 @@
 
 namespace audioguard {
 
+// Translate the tuned profile into ORT session settings.
+// A thread count of 0 keeps ONNX Runtime's own default.
+static Ort::SessionOptions make_session_options(const RuntimeProfile& profile) {
+    Ort::SessionOptions options;
+    if (profile.intra_op_threads > 0) {
+        options.SetIntraOpNumThreads(profile.intra_op_threads);
+    }
+    if (profile.inter_op_threads > 0) {
+        options.SetInterOpNumThreads(profile.inter_op_threads);
+    }
+    // Parallel execution only pays off with more than one inter-op thread;
+    // this sequential CNN otherwise just gets extra scheduling overhead.
+    if (profile.inter_op_threads > 1) {
+        options.SetExecutionMode(ExecutionMode::ORT_PARALLEL);
+    }
+    return options;
+}
+
 // Pimpl pattern to hide ONNX Runtime details from the header file
 struct InferenceEngine::Impl {
     Ort::Env env;
@@ -18,9 +36,9 @@ struct InferenceEngine::Impl {
     std::vector<const char*> output_node_names = {"dense_1"};
     std::vector<int64_t> input_dims;
 
-    Impl(const std::string& model_path) 
+    Impl(const std::string& model_path, const RuntimeProfile& profile) 
         : env(ORT_LOGGING_LEVEL_WARNING, "AudioGuard"), 
-          session(env, model_path.c_str(), Ort::SessionOptions()) {
+          session(env, model_path.c_str(), make_session_options(profile)) {
         
         // Auto-detect input shape from the model
         // Note: For simplicity in this specific project, we assume [1, 16000] 
@@ -30,7 +48,10 @@ struct InferenceEngine::Impl {
 };
 
 InferenceEngine::InferenceEngine(const std::string& model_path)
-    : pImpl(std::make_unique<Impl>(model_path)) {}
+    : InferenceEngine(model_path, RuntimeProfile::from_env()) {}
+
+InferenceEngine::InferenceEngine(const std::string& model_path, const RuntimeProfile& profile)
+    : pImpl(std::make_unique<Impl>(model_path, profile)) {}
 
 InferenceEngine::~InferenceEngine() = default;
 
@@ -0,0 +1,87 @@
+#include "audioguard/RuntimeProfile.h"
+#include <cstdlib>
+#include <fstream>
+#include <sstream>
+
+namespace audioguard {
+
+namespace {
+
+std::string trim(const std::string& s) {
+    const char* ws = " \t\r\n";
+    size_t start = s.find_first_not_of(ws);
+    if (start == std::string::npos) return "";
+    size_t end = s.find_last_not_of(ws);
+    return s.substr(start, end - start + 1);
+}
+
+int parse_int(const std::string& key, const std::string& value, int min_value) {
+    try {
+        size_t pos = 0;
+        int parsed = std::stoi(value, &pos);
+        if (pos != value.size()) throw std::invalid_argument(value);
+        if (parsed < min_value) {
+            throw std::runtime_error("'" + key + "' must be >= " + std::to_string(min_value) +
+                                     " in runtime profile, got " + value);
+        }
+        return parsed;
+    } catch (const std::runtime_error&) {
+        throw;
+    } catch (const std::exception&) {
+        throw std::runtime_error("Invalid value for '" + key + "' in runtime profile: " + value);
+    }
+}
+
+} // namespace
+
+RuntimeProfile RuntimeProfile::load(const std::string& filepath) {
+    std::ifstream in(filepath);
+    if (!in) {
+        throw std::runtime_error("Could not open runtime profile: " + filepath);
+    }
+
+    RuntimeProfile profile;
+    std::string line;
+    while (std::getline(in, line)) {
+        // Strip comments and skip blank lines
+        line = trim(line.substr(0, line.find('#')));
+        if (line.empty()) continue;
+
+        size_t eq = line.find('=');
+        if (eq == std::string::npos) {
+            throw std::runtime_error("Malformed line in runtime profile: " + line);
+        }
+        std::string key = trim(line.substr(0, eq));
+        std::string value = trim(line.substr(eq + 1));
+
+        // 0 means "let ORT decide" for thread counts; host-side knobs need at least 1
+        if (key == "intra_op_threads") profile.intra_op_threads = parse_int(key, value, 0);
+        else if (key == "inter_op_threads") profile.inter_op_threads = parse_int(key, value, 0);
+        else if (key == "dsp_workers") profile.dsp_workers = parse_int(key, value, 1);
+        else if (key == "batch_size") profile.batch_size = parse_int(key, value, 1);
+        else if (key == "instance_count") profile.instance_count = parse_int(key, value, 1);
+    }
+    return profile;
+}
+
+RuntimeProfile RuntimeProfile::from_env() {
+    const char* path = std::getenv(PROFILE_ENV_VAR);
+    if (path == nullptr || path[0] == '\0') {
+        return RuntimeProfile();
+    }
+    return load(path);
+}
+
+void RuntimeProfile::save(const std::string& filepath) const {
+    std::ofstream out(filepath);
+    if (!out) {
+        throw std::runtime_error("Could not write runtime profile: " + filepath);
+    }
+    out << "intra_op_threads = " << intra_op_threads << "\n"
+        << "inter_op_threads = " << inter_op_threads << "\n"
+        << "dsp_workers = " << dsp_workers << "\n"
+        << "batch_size = " << batch_size << "\n"
+        << "instance_count = " << instance_count << "\n";
+}
+
+} // namespace audioguard